@@ -1 +1,6 @@
-from .reservations import Reservations
\ No newline at end of file
+def __getattr__(name):
+    # Reservations is imported on first use so importing the package (e.g., for the CLI) doesn't import pandas
+    if name == "Reservations":
+        from .reservations import Reservations
+        return Reservations
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,10 +1,11 @@
 import argparse
-from pyfedcamp.reservations import Reservations
-from pyfedcamp.placards import build_placards
 import sys
 
-def main():
-    parser = argparse.ArgumentParser(description="Process Recreation.gov Camping Reservation Detail Report spreadsheet.")
+def _argparser():
+    parser = argparse.ArgumentParser(
+        description="Process Recreation.gov Camping Reservation Detail Report spreadsheet.",
+        epilog="Spreadsheets are read with python-calamine when it is installed (pip install pyfedcamp[calamine]), otherwise with openpyxl."
+    )
     subparsers = parser.add_subparsers(dest="command", required=True)
 
     # Placards subcommand
@@ -29,6 +30,12 @@ def main():
         help="Filename for the generated placards PDF",
         type=str
     )
+    placards_parser.add_argument(
+        "--campsites", 
+        nargs="+",
+        help="List of specific campsites to include",
+        type=str
+    )
     placards_parser.add_argument(
         "--agency", 
         default="NPS", 
@@ -70,12 +77,22 @@ def main():
     pkg_parser.add_argument("input_file", help="Path to the reservation spreadsheet (Excel file)")
     pkg_parser.add_argument("--format", choices=["zip", "tar.gz"], default="zip", help="Archive format")
     pkg_parser.add_argument("--output_path", default=None, help="Path with filename to save archive (if omitted, stream to stdout)")
+    pkg_parser.add_argument("--compression_level", type=int, choices=range(1, 10), default=6, metavar="{1-9}", help="Compression level; lower is faster, higher is smaller")
 
-    args = parser.parse_args()
+    return parser
+
+def main():
+    args = _argparser().parse_args()
+
+    # Imported here so --help and argument errors don't pay for importing pandas and reportlab
+    from pyfedcamp.reservations import Reservations
+
+    res = Reservations(input_file=args.input_file)
 
     if args.command == "placards":
-        res = Reservations(input_file=args.input_file)
-        placard_records_df = res.reservations[res.reservations['CheckInTag']][
+        from pyfedcamp.placards import build_placards
+
+        placard_records_df = res.get_checkin_reservations(args.campsites)[
             [
                 'ReservationNumber',
                 'SiteNumber',
@@ -89,7 +106,7 @@ def main():
             print("No reservations found with current/future arrival dates. No placards will be generated.")
             return
         build_placards(
-            placard_records=placard_records_df.to_dict(orient='records'),
+            placard_records=placard_records_df,
             output_path=args.output_path,
             filename=args.filename,
             agency=args.agency,
@@ -100,20 +117,19 @@ def main():
         print(f"Placards generated and saved to {args.output_path}/{args.filename}")
 
     elif args.command == "reports":
-        res = Reservations(input_file=args.input_file)
         # Placeholder for report generation logic
         print(f"Reports generated and saved to {args.output_path}/{args.reports_filename}")
 
     elif args.command == "download-data":
-        res = Reservations(input_file=args.input_file)
         if args.output_path:
             out_path = args.output_path
-            res.build_download_package(format=args.format, output_path=out_path)
+            res.build_download_package(format=args.format, output_path=out_path, compression_level=args.compression_level)
             print(f"Archive written to {out_path}")
         else:
-            # Stream to stdout (for piping or web)
-            data = res.build_download_package(format=args.format, output_path=None)
-            sys.stdout.buffer.write(data)
+            # Stream to stdout (for piping or web) through a large write buffer
+            sys.stdout.flush()
+            with open(sys.stdout.fileno(), "wb", buffering=1 << 20, closefd=False) as stdout:
+                res.build_download_package(format=args.format, output_path=stdout, compression_level=args.compression_level)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
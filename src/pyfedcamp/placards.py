@@ -1,13 +1,32 @@
 import io
 import os
 from datetime import datetime
-from typing import List, Optional
+from functools import lru_cache
+from typing import List, Optional, Union
+import pandas as pd
 from reportlab.lib.pagesizes import landscape
+from reportlab.lib.utils import ImageReader
 from reportlab.pdfgen import canvas
 import importlib.resources
 
+# Reservation fields drawn on each placard
+PLACARD_FIELDS = [
+    'SiteNumber',
+    'ArrivalDate',
+    'DepartureDate',
+    'Primary Occupant Name',
+    'ReservationNumber',
+    'Occupants'
+]
+
+@lru_cache(maxsize=None)
+def _load_logo(agency: str) -> ImageReader:
+    # Decode each agency's logo once per process from the package resources, which also works when the
+    # package is not on disk; the reader keeps the decoded image for every later build_placards call
+    return ImageReader(io.BytesIO(importlib.resources.files('pyfedcamp.static').joinpath(f'{agency}_logo.png').read_bytes()))
+
 def build_placards(
-        placard_records: List[dict],
+        placard_records: Union[List[dict], pd.DataFrame],
         filename: Optional[str] = None, 
         output_path: str = '.',
         agency: str = 'NPS',
@@ -30,8 +49,7 @@ def build_placards(
     info_box_height = 100
     info_box_width = placard_width / 3
 
-    with importlib.resources.path('pyfedcamp.static', f'{agency}_logo.png') as logo_path:
-        logo = str(logo_path)
+    logo = _load_logo(agency)
 
     if filename is None:
         buffer = io.BytesIO()
@@ -41,92 +59,116 @@ def build_placards(
         file_output = os.path.join(output_path, filename)
         c = canvas.Canvas(file_output, pagesize=landscape((canvas_width, canvas_height)))
 
-    quadrant_positions = [
+    quadrant_positions = (
         (0, canvas_height / 2),  # Top-left
         (canvas_width / 2, canvas_height / 2),  # Top-right
         (0, 0),  # Bottom-left
         (canvas_width / 2, 0)  # Bottom-right
-    ]
+    )
+
+    labels_y = placard_height - 140
+    arrival_x = placard_width / 2 - 50
+    departure_x = placard_width / 2 + 70
+
+    # Draw the content shared by every placard once as a form that each placard re-uses;
+    # the bounding box is padded so the stroke of the outer rectangle is not clipped
+    c.beginForm("placard_chrome", lowerx=-1, lowery=-1, upperx=placard_width + 1, uppery=placard_height + 1)
 
-    for i, reservation in enumerate(placard_records):
+    # Draw the rectangle for the placard
+    c.rect(0, 0, placard_width, placard_height, stroke=1, fill=0)
+
+    # Draw the logo
+    c.drawImage(logo, x=margin_width, y=placard_height - logo_height - margin_width - 30, width=logo_width, height=logo_height)
+
+    # Add text content
+    title_box = c.beginText()
+    title_box.setTextOrigin(margin_width + logo_width + 10, placard_height - 60)
+    title_box.setFont("Helvetica", 12)
+    if location:
+        title_box.textLine(location)
+    else:
+        title_box.textLine(fed_unit)
+        title_box.textLine(campground)
+    title_box.textLine("")
+    title_box.setFont("Helvetica-Bold", 18)
+    title_box.textLine("RESERVED SITE")
+    c.drawText(title_box)
+
+    help_box = c.beginText()
+    help_box.setTextOrigin(margin_width, margin_width + 40)
+    help_box.setFont("Helvetica", 8)
+    if camp_host_site:
+        help_box.textLine(f"For immediate assistance: contact camp host in site {camp_host_site}")
+    help_box.textLine("For reservations: www.recreation.gov or call 1-877-444-6777")
+    help_box.textLine("Placard printed: " + datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+    c.drawText(help_box)
+
+    for j in range(3):
+        c.rect(j * info_box_width, info_box_y + 50, info_box_width, info_box_height, stroke=1, fill=0)
+
+    # Labels for the reservation details, which are drawn below them in 12pt lines
+    c.setFont("Helvetica", 10)
+    c.drawString(margin_width, labels_y, "Visitor:")
+    c.drawString(arrival_x, labels_y, "Arrival:")
+    c.drawString(departure_x, labels_y, "Departure:")
+
+    c.endForm()
+
+    # Positions of the reservation details within a placard
+    site_right = placard_width - margin_width
+    site_y = placard_height - 110
+    visitor_y = labels_y - 2 * 12
+    date_y = labels_y - 3 * 12
+    departure_day_y = date_y - 2 * 18
+
+    # Placard records may be a DataFrame or a list of dicts; either way, iterate the fields drawn column by column
+    if not isinstance(placard_records, pd.DataFrame):
+        placard_records = pd.DataFrame(list(placard_records), columns=PLACARD_FIELDS)
+
+    # The departure month and day are drawn separately, so split them for every placard at once
+    departure_parts = placard_records['DepartureDate'].astype(str).str.split('/')
+    placard_rows = zip(
+        placard_records['SiteNumber'],
+        placard_records['ArrivalDate'],
+        departure_parts.str[0],
+        departure_parts.str[-1],
+        placard_records['Primary Occupant Name'],
+        placard_records['ReservationNumber'],
+        placard_records['Occupants']
+    )
+
+    for i, (site_number, arrival_date, departure_month, departure_day, occupant_name, reservation_number, occupants) in enumerate(placard_rows):
         # Determine the quadrant for the current placard
         quadrant_index = i % 4
         x_offset, y_offset = quadrant_positions[quadrant_index]
 
-        # Draw the rectangle for the placard
-        c.rect(x_offset, y_offset, placard_width, placard_height, stroke=1, fill=0)
-
-        # Draw the logo
-        c.drawImage(logo, x=x_offset + margin_width, y=y_offset + placard_height - logo_height - margin_width - 30, width=logo_width, height=logo_height)
-
-        # Add text content
-        title_box = c.beginText()
-        title_box.setTextOrigin(x_offset + margin_width + logo_width + 10, y_offset + placard_height - 60)
-        title_box.setFont("Helvetica", 12)
-        if location:
-            title_box.textLine(location)
-        else:
-            title_box.textLine(fed_unit)
-            title_box.textLine(campground)
-        title_box.textLine("")
-        title_box.setFont("Helvetica-Bold", 18)
-        title_box.textLine("RESERVED SITE")
-        c.drawText(title_box)
-
-        site_text = f"Site: {reservation['SiteNumber']}"
-        site_text_width = c.stringWidth(site_text, "Helvetica-Bold", 14)
-        site_text_pos = x_offset + placard_width - site_text_width - margin_width
+        # Draw the shared content, then the reservation details, relative to the placard's corner
+        c.saveState()
+        c.translate(x_offset, y_offset)
+        c.doForm("placard_chrome")
+
+        site_text = f"Site: {site_number}"
         c.setFont("Helvetica-Bold", 14)
-        c.drawString(site_text_pos, y_offset + placard_height - 110, site_text)
+        c.drawString(site_right - c.stringWidth(site_text, "Helvetica-Bold", 14), site_y, site_text)
 
-        visitor_box = c.beginText()
-        visitor_box.setTextOrigin(x_offset + margin_width, y_offset + placard_height - 140)
-        visitor_box.setFont("Helvetica", 10)
-        visitor_box.textLine("Visitor:")
-        visitor_box.textLine("")
+        visitor_box = c.beginText(margin_width, visitor_y)
         visitor_box.setFont("Helvetica-Bold", 14)
-        visitor_box.textLine(reservation['Primary Occupant Name'])
+        visitor_box.textLine(occupant_name)
         visitor_box.textLine("")
         visitor_box.setFont("Helvetica", 10)
-        visitor_box.textLine(f"Reservation#: {reservation['ReservationNumber']}")
-        visitor_box.textLine(f"Occupants: {reservation['Occupants']}")
+        visitor_box.textLine(f"Reservation#: {reservation_number}")
+        visitor_box.textLine(f"Occupants: {occupants}")
         c.drawText(visitor_box)
 
-        arrival_box = c.beginText()
-        arrival_box.setTextOrigin(x_offset + placard_width / 2 - 50, y_offset + placard_height - 140)
-        arrival_box.setFont("Helvetica", 10)
-        arrival_box.textLine("Arrival:")
-        arrival_box.textLine("")
-        arrival_box.textLine("")
-        arrival_box.setFont("Helvetica-Bold", 30)
-        arrival_box.textLine(reservation['ArrivalDate'])
-        c.drawText(arrival_box)
-
-        departure_box = c.beginText()
-        departure_box.setTextOrigin(x_offset + placard_width / 2 + 70, y_offset + placard_height - 140)
-        departure_box.setFont("Helvetica", 10)
-        departure_box.textLine("Departure:")
-        departure_box.textLine("")
-        departure_box.textLine("")
-        departure_box.setFont("Helvetica-Bold", 15)
-        departure_box.textLine(f"{str(reservation['DepartureDate']).split('/')[0]}/")
-        departure_box.textLine("")
-        departure_box.setFont("Helvetica-Bold", 80)
-        departure_box.textLine(f" {str(reservation['DepartureDate']).split('/')[-1]}")
-        c.drawText(departure_box)
-
-        help_box = c.beginText()
-        help_box.setTextOrigin(x_offset + margin_width, y_offset + margin_width + 40)
-        help_box.setFont("Helvetica", 8)
-        if camp_host_site:
-            help_box.textLine(f"For immediate assistance: contact camp host in site {camp_host_site}")
-        help_box.textLine("For reservations: www.recreation.gov or call 1-877-444-6777")
-        help_box.textLine("Placard printed: " + datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
-        c.drawText(help_box)
-
-        for j in range(3):
-            info_box_x = x_offset + j * info_box_width
-            c.rect(info_box_x, y_offset + info_box_y + 50, info_box_width, info_box_height, stroke=1, fill=0)
+        c.setFont("Helvetica-Bold", 30)
+        c.drawString(arrival_x, date_y, arrival_date)
+
+        c.setFont("Helvetica-Bold", 15)
+        c.drawString(departure_x, date_y, f"{departure_month}/")
+        c.setFont("Helvetica-Bold", 80)
+        c.drawString(departure_x, departure_day_y, f" {departure_day}")
+
+        c.restoreState()
 
         # Start a new page after every 4 placards
         if quadrant_index == 3:
@@ -1,53 +1,164 @@
 # Copyright (c) 2025 SkyBuilds, LLC
 # This file is part of pyfedcamp and is licensed under the MIT License.
 
+import numpy as np
 import pandas as pd
 import os
-import random
 import re
+import calendar
+import warnings
 from datetime import date, datetime
+from functools import cached_property
+from typing import Optional
+import gzip
+import hashlib
 import io
+import itertools
+import operator
 import zipfile
 import tarfile
-import tempfile
-import re
-import dateutil.parser
+import time
+import shutil
+import subprocess
+import threading
+import openpyxl
+from openpyxl.utils.exceptions import InvalidFileException
+
+try:
+    from python_calamine import CalamineWorkbook
+except ImportError:
+    CalamineWorkbook = None
+
+# Text columns are Arrow-backed when pyarrow is installed, which stores them as contiguous UTF-8 buffers
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+    _STRING_DTYPE = pd.StringDtype('python')
+else:
+    _STRING_DTYPE = pd.StringDtype('pyarrow')
+
+_NAME_RE = re.compile(r"^[A-Za-z]+\.*?, [A-Za-z]\.*$")
+# An Equipment item of "Tent" or "Small Tent", with an optional "(n)" quantity
+# (no lookahead, so the pattern also runs on pyarrow's RE2 engine for Arrow-backed strings)
+_TENT_ITEM_RE = re.compile(r'(?:^|,)\s*(?:small )?tent(?:\s*\(\d+\))?\s*(?:,|$)', re.IGNORECASE)
+_RUN_DATE_RE = re.compile(r"Run Date and Time:\s*(.+)")
+
+# Fixed categories for derived classification columns, so their dtypes don't depend on which values appear in a report
+_FOOTPRINT_DTYPE = pd.CategoricalDtype(['tent', 'RV', 'unknown'])
+_DURATION_DTYPE = pd.CategoricalDtype(['single night', 'first night', 'continuing night'])
+_MONTH_DTYPE = pd.CategoricalDtype(list(calendar.month_name)[1:], ordered=True)
+_DAY_DTYPE = pd.CategoricalDtype(list(calendar.day_name), ordered=True)
+
+# Number of leading rows searched for the column headings
+_MAX_HEADER_ROWS = 20
+
+# Format of the Arrival Date and Departure Date cells in the report
+_REPORT_DATE_FORMAT = '%m/%d/%Y'
+
+# Write buffer used for download package archives (1 MiB)
+_ARCHIVE_BUFFER_SIZE = 1 << 20
+
+# Native gzip binary used to compress tar.gz download packages, preferring parallel pigz
+_GZIP_COMMAND = shutil.which("pigz") or shutil.which("gzip")
+
+# Bumped whenever the processed reservations change shape, so older cache entries are not re-used
+_CACHE_VERSION = 1
 
 class Reservations:
     def __init__(
             self, 
-            input_file: str
+            input_file: str,
+            cache_dir: Optional[str] = None
         ):
         self.input_file = input_file
 
         if not os.path.exists(input_file):
             raise FileNotFoundError(f"The file {input_file} does not exist.")
-        
-        self.process_spreadsheet()
+
+        # With a cache directory, processed reservations are kept as Parquet and re-used until the spreadsheet changes
+        if cache_dir is None:
+            self.process_spreadsheet()
+            return
+        if pyarrow is None:
+            raise ImportError("cache_dir requires pyarrow; install it with the pyfedcamp[arrow] extra.")
+        cache_path = _cache_path(cache_dir, input_file)
+        if os.path.exists(cache_path):
+            self._load_cache(cache_path)
+        else:
+            self.process_spreadsheet()
+            self._save_cache(cache_path)
+
+    # Derived DataFrames are built on first access so callers that only need reservations skip the work
+    @cached_property
+    def occupied_reservations_by_day(self):
         self.get_occupied_overnights()
+        return self.occupied_reservations_by_day
+
+    @cached_property
+    def daily_reservation_summary(self):
         self.summarize_reservations()
+        return self.daily_reservation_summary
+
+    @cached_property
+    def busiest_days(self):
         self.busiest_day_of_week()
+        return self.busiest_days
+
+    # Reservations ready for check-in, indexed by site so repeated campsite selections are hash lookups
+    @cached_property
+    def checkin_reservations(self):
+        return self.reservations[self.reservations['CheckInTag']].set_index('SiteNumber', drop=False).rename_axis(None)
+
+    def get_checkin_reservations(self, campsites=None):
+        # Reservations ready for check-in, optionally limited to the given campsites
+        if campsites is None:
+            return self.checkin_reservations
+        return self.checkin_reservations.loc[self.checkin_reservations.index.intersection(campsites)]
 
     def process_spreadsheet(self):
-        import warnings
-        warnings.filterwarnings("ignore", category=UserWarning, module="openpyxl")
+        required_columns = [
+            'Loop',
+            'Site #',
+            'Reservation #', 
+            'Reservation Status',
+            'Arrival Date', 
+            'Departure Date',
+            'Primary Occupant Name',
+            '# of Occupants',
+            'Equipment',
+            'Nights/ Days',
+        ]
 
+        # Stream rows from the workbook up to the column headings, which sit in the first few rows of the report
+        required_set = frozenset(required_columns)
         try:
-            df = pd.read_excel(self.input_file, engine='openpyxl', header=None)
+            rows = _iter_workbook_rows(self.input_file)
+            preamble = []
+            header = None
+            for row in itertools.islice(rows, _MAX_HEADER_ROWS):
+                if required_set.issubset(row):
+                    header = row
+                    break
+                if len(preamble) < 10:
+                    preamble.append(row)
         except Exception as e:
             raise ValueError(f"Error reading the Excel file: {e}")
 
+        # Ensure we have a valid header row in the spreadsheet
+        if header is None:
+            raise ValueError("No row found that contains all required columns.")
+
         # --- Extract Location and Run Date/Time from the first few rows ---
         self.location = None
         self.run_date = None
-        for i in range(min(10, len(df))):
-            row = df.iloc[i].astype(str)
-            first_cell = row.iloc[0]
+        for row in preamble:
+            first_cell = str(row[0])
             if first_cell.startswith("Location:"):
                 self.location = first_cell.replace("Location:", "").strip()
             elif first_cell.startswith("Run Date and Time:"):
                 # e.g., "Run Date and Time: Jul 07, 2025, 08:08:00 US/Mountain"
-                match = re.search(r"Run Date and Time:\s*(.+)", first_cell)
+                match = _RUN_DATE_RE.search(first_cell)
                 if match:
                     date_str = match.group(1)
                     date_str_parts = date_str.rsplit(' ', 1)
@@ -57,38 +168,28 @@ class Reservations:
                     else:
                         self.run_date = date_str
 
-        required_columns = [
-            'Loop',
-            'Site #',
-            'Reservation #', 
-            'Reservation Status',
-            'Arrival Date', 
-            'Departure Date',
-            'Primary Occupant Name',
-            '# of Occupants',
-            'Equipment',
-            'Nights/ Days',
-        ]
-
-        header_row_index = df.apply(lambda row: all(col in row.values for col in required_columns), axis=1).idxmax()
-
-        # Ensure we have a valid header row in the spreadsheet
-        if header_row_index == 0:
-            raise ValueError("No row found that contains all required columns.")
-
-        # Rebuild the DataFrame with the correct column names
-        df.columns = df.iloc[header_row_index]
-        df = df[header_row_index + 1:].reset_index(drop=True)
+        # Build the DataFrame from the remaining rows, keeping only the required columns; rows that end
+        # early (trailing empty cells) are padded to the header width first
+        width = len(header)
+        get_required = operator.itemgetter(*[header.index(col) for col in required_columns])
+        try:
+            df = pd.DataFrame.from_records(
+                (get_required(row if len(row) >= width else row + (None,) * (width - len(row))) for row in rows),
+                columns=required_columns
+            )
+        except Exception as e:
+            raise ValueError(f"Error reading the Excel file: {e}")
 
-        # Set a variable for the original data
-        self.original_data = df.copy()
+        # Identifiers are kept as strings regardless of how the cells were typed in the workbook; the small,
+        # repeated set of site numbers is stored as a categorical so per-day site counts work on integer codes
+        df = df.astype({'Reservation #': _STRING_DTYPE, 'Site #': _STRING_DTYPE, 'Primary Occupant Name': _STRING_DTYPE})
+        df['Site #'] = df['Site #'].astype('category')
 
-        # Validate random sampling of "Primary Occupant Name"
+        # Validate random sampling of "Primary Occupant Name"; a fixed seed keeps the check reproducible for a given file
         sample_size = min(10, len(df))  # Check up to 10 random rows
-        sampled_names = random.sample(list(df['Primary Occupant Name']), sample_size)
-        invalid_names = [name for name in sampled_names if not validate_name_format(name)]
+        sampled_names = df['Primary Occupant Name'].sample(n=sample_size, random_state=0)
 
-        if invalid_names:
+        if not sampled_names.str.match(_NAME_RE).fillna(False).all():
             raise ValueError(f"Names in the 'Primary Occupant Name' column do not appear to be obfuscated for PII. The spreadsheet cannot be processed.")
 
         # Rename the site # field
@@ -96,38 +197,44 @@ class Reservations:
 
         # Set date columns to datetime format and create string representations
         for col in ['Arrival Date', 'Departure Date']:
-            df[col] = pd.to_datetime(df[col], errors='coerce')
-            df[col.replace(" ", "")] = df[col].dt.strftime('%m/%d')
+            df[col] = _parse_dates(df[col])
+            df[col.replace(" ", "")] = _format_month_day(df[col])
 
         # Set the CheckInTag value based on current/future arrival dates and reservation status
-        today = pd.to_datetime(datetime.today().date())
-        df['CheckInTag'] = df.apply(lambda row: (row['Arrival Date'] >= today) and (row['Reservation Status'] == 'RESERVED'), axis=1)
+        # Reservation Status is compared several times below; as a categorical, comparisons work on integer codes
+        df['Reservation Status'] = df['Reservation Status'].astype('category')
+        today = pd.Timestamp(date.today())
+        df['CheckInTag'] = df['Arrival Date'].ge(today) & df['Reservation Status'].eq('RESERVED')
 
         # Set an obfuscated version of the Reservation Number
-        df['ReservationNumber'] = df['Reservation #'].apply(lambda x: f"...{str(x)[-6:]}")
+        df['ReservationNumber'] = '...' + df['Reservation #'].str[-6:]
 
-        # Split the 'Equipment' column into a list of equipment items, handle empty/missing values
-        df['Equipment List'] = df['Equipment'].apply(
-            lambda x: [re.sub(r'\s*\(\d+\)$', '', item.strip()) for item in x.split(',')] if pd.notnull(x) and str(x).strip() else []
-        )
-
-        # Set Camper Footprint: 'tent', 'RV', or 'unknown' if equipment list is empty
-        df['Camper Footprint'] = df['Equipment List'].apply(
-            lambda equipment: (
-                'tent' if any(item.lower() in ['tent', 'small tent'] for item in equipment)
-                else 'RV' if equipment else 'unknown'
-            )
-        )
+        # Set Camper Footprint from the comma-separated Equipment items (e.g., "Small Tent (1), Car"):
+        # 'tent' if any item is a tent, 'RV' for other equipment, or 'unknown' if no equipment is listed
+        equipment = df['Equipment'].astype(_STRING_DTYPE)
+        has_equipment = equipment.str.strip().fillna('').ne('')
+        has_tent = equipment.str.contains(_TENT_ITEM_RE).fillna(False).astype(bool)
+        df['Camper Footprint'] = pd.Categorical(np.select([has_tent, has_equipment], ['tent', 'RV'], default='unknown'), dtype=_FOOTPRINT_DTYPE)
 
         # Use the reservation status to set variables for reservations observed by staff and (presumably) occupied by guests
-        df['observed'] = df['Reservation Status'].isin(['CHECKED_IN', 'CHECKED_OUT'])
-        df['occupied'] = df['Reservation Status'].isin(['CHECKED_IN', 'CHECKED_OUT', 'RESERVED'])
-
-        # Ensure "Nights/ Days" is an integer
-        df['Overnights'] = pd.to_numeric(df['Nights/ Days'], errors='coerce').fillna(0).astype(int)
+        # Flags are looked up per status category and gathered by code; the trailing False row covers missing statuses (code -1)
+        status_categories = df['Reservation Status'].cat.categories
+        status_flags = np.vstack([
+            np.column_stack([
+                status_categories.isin(['CHECKED_IN', 'CHECKED_OUT']),
+                status_categories.isin(['CHECKED_IN', 'CHECKED_OUT', 'RESERVED'])
+            ]),
+            [False, False]
+        ])
+        flags = status_flags[df['Reservation Status'].cat.codes.to_numpy()]
+        df['observed'] = flags[:, 0]
+        df['occupied'] = flags[:, 1]
+
+        # Ensure "Nights/ Days" is an integer; int16 comfortably holds night and occupant counts
+        df['Overnights'] = pd.to_numeric(df['Nights/ Days'], errors='coerce').fillna(0).astype('int16')
 
         # Ensure # of Occupants is an integer for report generation
-        df['Occupants'] = pd.to_numeric(df['# of Occupants'], errors='coerce').fillna(0).astype(int)
+        df['Occupants'] = pd.to_numeric(df['# of Occupants'], errors='coerce').fillna(0).astype('int16')
 
         # Set the resulting dataframe and serializable JSON structure
         core_attributes = [
@@ -146,70 +253,104 @@ class Reservations:
             'Occupants',
             'Primary Occupant Name'
         ]
-        self.reservations = df[core_attributes].copy()
+        self.reservations = df[core_attributes]
+
+    def _save_cache(self, cache_path):
+        # Spreadsheet metadata travels in the Parquet file's pandas attrs, which must be JSON serializable
+        run_date_tz = getattr(self, 'run_date_tz', None)
+        frame = self.reservations.copy(deep=False)
+        frame.attrs = {
+            'location': self.location,
+            'run_date': self.run_date.isoformat() if run_date_tz is not None else self.run_date,
+            'run_date_tz': run_date_tz,
+        }
+        # Write to a temporary file first so a concurrent reader never sees a partial cache entry
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        temp_path = f"{cache_path}.{os.getpid()}.tmp"
+        frame.to_parquet(temp_path, compression='zstd')
+        os.replace(temp_path, cache_path)
+
+    def _load_cache(self, cache_path):
+        df = pd.read_parquet(cache_path)
+        metadata, df.attrs = df.attrs, {}
+        self.location = metadata['location']
+        self.run_date = metadata['run_date']
+        if metadata['run_date_tz'] is not None:
+            self.run_date = datetime.fromisoformat(self.run_date)
+            self.run_date_tz = metadata['run_date_tz']
+        # Parquet keeps categorical codes but not the string dtype of the site categories, and older pandas
+        # reads the text columns back as Python-backed strings
+        df = df.astype({col: _STRING_DTYPE for col in df.columns if isinstance(df[col].dtype, pd.StringDtype)})
+        df['SiteNumber'] = df['SiteNumber'].cat.rename_categories(df['SiteNumber'].cat.categories.astype(_STRING_DTYPE))
+        # CheckInTag depends on the current date; reservations arriving before today no longer qualify
+        df['CheckInTag'] &= df['Arrival Date'].ge(pd.Timestamp(date.today()))
+        self.reservations = df
 
     def get_occupied_overnights(self):
-        # Expand reservations into individual nights with Reservation Footprint
-        expanded_rows = []
-        for idx, row in self.reservations[self.reservations['occupied']].iterrows():
-            arrival = row['Arrival Date']
-            departure = row['Departure Date']
-            nights = (departure - arrival).days
-            for i, single_date in enumerate(pd.date_range(arrival, departure - pd.Timedelta(days=1))):
-                if nights == 1:
-                    footprint = "single night"
-                elif i == 0:
-                    footprint = "first night"
-                else:
-                    footprint = "continuing night"
-                expanded_row = row.copy()
-                expanded_row['Occupied Date'] = single_date
-                expanded_row['Duration'] = footprint
-                expanded_rows.append(expanded_row)
-
-        occupied_reservation_dates = pd.DataFrame(expanded_rows)
-        occupied_reservation_dates = occupied_reservation_dates[[
-            'Occupied Date',
-            'SiteNumber',
-            'Camper Footprint',
-            'Occupants',
-            'Duration'
-        ]]
-
-        self.occupied_reservations_by_day = occupied_reservation_dates.copy()
+        # Expand reservations into individual nights with Reservation Footprint, replicating only the columns carried forward
+        occupied = self.reservations[self.reservations['occupied']]
+        # Work on whole days so the expansion is plain integer arithmetic; missing dates give a negative count and no nights
+        arrival_days = occupied['Arrival Date'].to_numpy().astype('datetime64[D]')
+        departure_days = occupied['Departure Date'].to_numpy().astype('datetime64[D]')
+        nights = (departure_days - arrival_days).astype('int64').clip(min=0)
+        expanded = occupied[['SiteNumber', 'Camper Footprint', 'Occupants']].take(
+            np.repeat(np.arange(len(occupied)), nights)
+        ).reset_index(drop=True)
+
+        # Offset of each night from the arrival date within its reservation
+        night_offsets = np.arange(nights.sum(), dtype='int64') - np.repeat(nights.cumsum() - nights, nights)
+        expanded_nights = np.repeat(nights, nights)
+
+        occupied_dates = np.repeat(arrival_days, nights) + night_offsets.astype('timedelta64[D]')
+        expanded.insert(0, 'Occupied Date', occupied_dates.astype(occupied['Arrival Date'].dtype))
+        expanded['Duration'] = pd.Categorical(np.select(
+            [expanded_nights == 1, night_offsets == 0],
+            ['single night', 'first night'],
+            default='continuing night'
+        ), dtype=_DURATION_DTYPE)
+
+        self.occupied_reservations_by_day = expanded
 
     def summarize_reservations(self):
-        # 1. Total sites and total occupants per day
-        summary_stats = self.occupied_reservations_by_day.groupby('Occupied Date').agg(
+        by_day = self.occupied_reservations_by_day
+        footprint = by_day['Camper Footprint']
+        duration = by_day['Duration']
+        occupants = by_day['Occupants'].astype('int64')
+        # Site category codes, with missing sites (code -1) left missing so nunique skips them
+        site_codes = by_day['SiteNumber'].astype('category').cat.codes.where(lambda codes: codes >= 0)
+
+        # Helper columns turn the footprint and duration breakdowns into plain per-day aggregates;
+        # sites outside a footprint are left missing so nunique skips them
+        helpers = pd.DataFrame({
+            'Occupied Date': by_day['Occupied Date'],
+            'SiteNumber': site_codes,
+            'Occupants': occupants,
+            'rv_site': site_codes.where(footprint.eq('RV')),
+            'tent_site': site_codes.where(footprint.eq('tent')),
+            'unknown_site': site_codes.where(footprint.eq('unknown')),
+            'continuing_night': occupants.where(duration.eq('continuing night'), 0),
+            'first_night': occupants.where(duration.eq('first night'), 0),
+            'single_night': occupants.where(duration.eq('single night'), 0),
+        })
+
+        # Total sites and occupants, sites by camper footprint, and occupants by duration per day in one grouped pass
+        summary_stats = helpers.groupby('Occupied Date').agg(
             total_sites=('SiteNumber', 'nunique'),
-            total_occupants=('Occupants', 'sum')
+            total_occupants=('Occupants', 'sum'),
+            rv_sites=('rv_site', 'nunique'),
+            tent_sites=('tent_site', 'nunique'),
+            unknown=('unknown_site', 'nunique'),
+            continuing_night_occupants=('continuing_night', 'sum'),
+            first_night_occupants=('first_night', 'sum'),
+            single_night_occupants=('single_night', 'sum')
         ).reset_index()
 
-        # 2. RV and tent sites per day
-        footprint_sites = self.occupied_reservations_by_day.groupby(['Occupied Date', 'Camper Footprint'])['SiteNumber'].nunique().unstack(fill_value=0)
-        footprint_sites = footprint_sites.rename(columns={'RV': 'rv_sites', 'tent': 'tent_sites'}).reset_index()
-
-        # 3. Occupants by duration per day
-        duration_occupants = self.occupied_reservations_by_day.pivot_table(
-            index='Occupied Date',
-            columns='Duration',
-            values='Occupants',
-            aggfunc='sum',
-            fill_value=0
-        ).rename(columns={
-            'first night': 'first_night_occupants',
-            'single night': 'single_night_occupants',
-            'continuing night': 'continuing_night_occupants'
-        }).reset_index()
-
-        # 4. Merge all together
-        summary_stats = summary_stats.merge(footprint_sites, on='Occupied Date', how='left')
-        summary_stats = summary_stats.merge(duration_occupants, on='Occupied Date', how='left')
-
-        summary_stats['year'] = summary_stats['Occupied Date'].dt.year
-        summary_stats['month'] = summary_stats['Occupied Date'].dt.strftime('%B')
-        summary_stats['week'] = summary_stats['Occupied Date'].dt.isocalendar().week
-        summary_stats['day'] = summary_stats['Occupied Date'].dt.strftime('%A')
+        # Month and day names are looked up by their numeric codes rather than formatted per row
+        occupied_date = summary_stats['Occupied Date'].dt
+        summary_stats['year'] = occupied_date.year
+        summary_stats['month'] = pd.Categorical.from_codes(occupied_date.month.to_numpy() - 1, dtype=_MONTH_DTYPE)
+        summary_stats['week'] = occupied_date.isocalendar().week
+        summary_stats['day'] = pd.Categorical.from_codes(occupied_date.dayofweek.to_numpy(), dtype=_DAY_DTYPE)
 
         self.daily_reservation_summary = summary_stats
 
@@ -220,91 +361,222 @@ class Reservations:
             WEIGHT_CONTINUING: int = 1
         ):
         # 1. Calculate weighted occupants
-        df = self.daily_reservation_summary.copy()
-        df['weighted_occupants'] = (
-            WEIGHT_FIRST * df.get('first_night_occupants', 0) +
-            WEIGHT_SINGLE * df.get('single_night_occupants', 0) +
-            WEIGHT_CONTINUING * df.get('continuing_night_occupants', 0)
+        summary = self.daily_reservation_summary
+        weighted_occupants = (
+            WEIGHT_FIRST * summary['first_night_occupants'].to_numpy() +
+            WEIGHT_SINGLE * summary['single_night_occupants'].to_numpy() +
+            WEIGHT_CONTINUING * summary['continuing_night_occupants'].to_numpy()
         )
 
-        # 2. Identify the busiest day in each week
-        busiest_idx = df.groupby('week')['weighted_occupants'].idxmax()
-        busiest_days = df.loc[busiest_idx, ['week', 'Occupied Date', 'day', 'total_occupants', 'first_night_occupants', 'single_night_occupants', 'continuing_night_occupants', 'weighted_occupants']]
-        self.busiest_days = busiest_days.sort_values('week').reset_index(drop=True)
+        # 2. Identify the busiest day in each week: sort by week, then weight descending (stable, so ties keep
+        # the earliest day), and take the first row of each week
+        week = summary['week'].to_numpy(dtype='int64')
+        order = np.lexsort((-weighted_occupants, week))
+        _, first_in_week = np.unique(week[order], return_index=True)
+        busiest_rows = order[first_in_week]
+
+        busiest_days = summary.iloc[busiest_rows][['week', 'Occupied Date', 'day', 'total_occupants', 'first_night_occupants', 'single_night_occupants', 'continuing_night_occupants']]
+        busiest_days = busiest_days.assign(weighted_occupants=weighted_occupants[busiest_rows])
+        self.busiest_days = busiest_days.reset_index(drop=True)
 
     def build_download_package(
         self,
         format: str = "zip",
-        output_path: str = "."
+        output_path: str = ".",
+        compression_level: int = 6
     ):
         """
         Package major DataFrames as CSV files into a zip or tar.gz archive.
-        If output_path is None, returns bytes; else writes to output_path.
+        If output_path is None, returns bytes; else writes to output_path, which may be a file path or a
+        writable binary file object (e.g., sys.stdout.buffer). CSVs are written straight into the archive stream.
+        compression_level (1-9) trades archive size for speed; lower levels compress faster.
         """
+        if format not in ("zip", "tar", "tgz", "tar.gz"):
+            raise ValueError("Unsupported format. Use 'zip' or 'tar.gz'.")
+        if compression_level not in range(1, 10):
+            raise ValueError("Unsupported compression_level. Use an integer from 1 to 9.")
+
         # DataFrames to include
         dfs = {
             "reservations.csv": self.reservations,
             "occupied_reservations_by_day.csv": self.occupied_reservations_by_day,
             "daily_reservation_summary.csv": self.daily_reservation_summary,
+            "busiest_days.csv": self.busiest_days,
         }
-        if hasattr(self, "busiest_days"):
-            dfs["busiest_days.csv"] = self.busiest_days
 
-        # Use a temp directory for CSVs
-        with tempfile.TemporaryDirectory() as tmpdir:
-            csv_paths = []
+        # Prepare archive in memory, on disk through a large write buffer, or on the supplied stream
+        if output_path is None:
+            buffer = io.BytesIO()
+            _write_download_archive(buffer, format, dfs, compression_level)
+            return buffer.getvalue()
+        elif isinstance(output_path, (str, os.PathLike)):
+            with open(output_path, "wb", buffering=_ARCHIVE_BUFFER_SIZE) as fh:
+                _write_download_archive(fh, format, dfs, compression_level)
+        else:
+            _write_download_archive(output_path, format, dfs, compression_level)
+        return output_path
+
+def _write_download_archive(fileobj, format, dfs, compression_level=6):
+    if format == "zip":
+        with zipfile.ZipFile(fileobj, "w", zipfile.ZIP_DEFLATED, compresslevel=compression_level) as zf:
             for fname, df in dfs.items():
-                csv_path = os.path.join(tmpdir, fname)
-                df.to_csv(csv_path, index=False)
-                csv_paths.append((fname, csv_path))
-
-            # Prepare archive in memory or on disk
-            if output_path is None:
-                buffer = io.BytesIO()
-                if format == "zip":
-                    with zipfile.ZipFile(buffer, "w") as zf:
-                        for fname, path in csv_paths:
-                            zf.write(path, arcname=fname)
-                elif format in ("tar", "tgz", "tar.gz"):
-                    mode = "w:gz" if format in ("tgz", "tar.gz") else "w"
-                    with tarfile.open(fileobj=buffer, mode=mode) as tf:
-                        for fname, path in csv_paths:
-                            tf.add(path, arcname=fname)
-                else:
-                    raise ValueError("Unsupported format. Use 'zip' or 'tar.gz'.")
-                buffer.seek(0)
-                return buffer.getvalue()
-            else:
-                if format == "zip":
-                    with zipfile.ZipFile(output_path, "w") as zf:
-                        for fname, path in csv_paths:
-                            zf.write(path, arcname=fname)
-                elif format in ("tar", "tgz", "tar.gz"):
-                    mode = "w:gz" if format in ("tgz", "tar.gz") else "w"
-                    with tarfile.open(output_path, mode=mode) as tf:
-                        for fname, path in csv_paths:
-                            tf.add(path, arcname=fname)
-                else:
-                    raise ValueError("Unsupported format. Use 'zip' or 'tar.gz'.")
-                return output_path
+                # Opening by name applies the archive's compression and compresslevel to the entry
+                with zf.open(fname, "w", force_zip64=True) as fh:
+                    with io.TextIOWrapper(fh, encoding="utf-8", newline="") as text:
+                        df.to_csv(text, index=False)
+                # Entries opened by name default to owner-only permissions; the central directory is written on close
+                zf.getinfo(fname).external_attr = 0o644 << 16
+    elif format in ("tgz", "tar.gz") and _GZIP_COMMAND is not None:
+        _write_tar_gz_command(fileobj, dfs, compression_level)
+    elif format in ("tgz", "tar.gz"):
+        # Streaming tarfile modes do not take a compression level or header mtime, so gzip the plain tar stream directly
+        with gzip.GzipFile(fileobj=fileobj, mode="wb", compresslevel=compression_level, mtime=0) as gz:
+            _write_tar(gz, "w|", dfs)
+    else:
+        _write_tar(fileobj, "w|", dfs)
+
+def _write_tar_gz_command(fileobj, dfs, compression_level):
+    # Compress with the system pigz/gzip binary, draining its output on a separate thread
+    proc = subprocess.Popen([_GZIP_COMMAND, "-c", f"-{compression_level}"], stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+    drain_errors = []
+
+    def drain():
+        try:
+            shutil.copyfileobj(proc.stdout, fileobj, _ARCHIVE_BUFFER_SIZE)
+        except BaseException as e:
+            # Stop the compressor so the tar writer fails on the closed pipe instead of blocking on a full one
+            drain_errors.append(e)
+            proc.kill()
+
+    drain_thread = threading.Thread(target=drain)
+    drain_thread.start()
+    try:
+        with proc.stdin:
+            _write_tar(proc.stdin, "w|", dfs)
+    except BaseException:
+        proc.kill()
+        # A failed write to the destination is the cause of any broken pipe here, so report that instead
+        if not drain_errors:
+            raise
+    finally:
+        drain_thread.join()
+        proc.stdout.close()
+        proc.wait()
+    if drain_errors:
+        raise drain_errors[0]
+    if proc.returncode != 0:
+        raise RuntimeError(f"{_GZIP_COMMAND} exited with status {proc.returncode}")
+
+def _write_tar(fileobj, mode, dfs):
+    with tarfile.open(fileobj=fileobj, mode=mode, bufsize=_ARCHIVE_BUFFER_SIZE) as tf:
+        for fname, df in dfs.items():
+            data = df.to_csv(index=False).encode("utf-8")
+            info = tarfile.TarInfo(name=fname)
+            info.size = len(data)
+            info.mtime = int(time.time())
+            tf.addfile(info, io.BytesIO(data))
+
+def _cache_path(cache_dir, input_file):
+    # Cache entries are keyed by the spreadsheet's path, modification time, and size
+    stat = os.stat(input_file)
+    key = f"{_CACHE_VERSION}:{os.path.abspath(input_file)}:{stat.st_mtime_ns}:{stat.st_size}"
+    return os.path.join(cache_dir, f"{hashlib.sha1(key.encode('utf-8')).hexdigest()}.parquet")
+
+def _parse_dates(values):
+    """
+    Parses a Series of report dates (e.g., '7/08/2025'), parsing each distinct value once with the report's
+    date format. Falls back to pandas' format inference when a value does not match it. Unparseable values become NaT.
+    """
+    codes, unique_values = pd.factorize(values)
+    parsed = pd.to_datetime(unique_values, format=_REPORT_DATE_FORMAT, errors='coerce')
+    if parsed.isna().any():
+        parsed = pd.to_datetime(unique_values, errors='coerce')
+    return pd.Series(parsed.take(codes, allow_fill=True, fill_value=pd.NaT), index=values.index)
+
+def _format_month_day(dates):
+    """
+    Formats a datetime Series as zero-padded 'MM/DD' strings from its numeric month and day,
+    avoiding a per-element strftime call. Only the distinct dates are formatted. Missing dates stay missing.
+    """
+    codes, unique_dates = pd.factorize(dates)
+    unique_dates = pd.Series(unique_dates)
+    month = unique_dates.dt.month.astype('string').str.zfill(2)
+    day = unique_dates.dt.day.astype('string').str.zfill(2)
+    # Missing dates have code -1, which picks the trailing NA
+    formatted = pd.array([*(month + '/' + day), pd.NA], dtype=_STRING_DTYPE)
+    return pd.Series(formatted[codes], index=dates.index)
+
+def _iter_workbook_rows(path):
+    """
+    Yields the rows of the first worksheet in the workbook as tuples of cell values, skipping empty rows.
+    The Rust-backed python-calamine reader is used when it is installed; otherwise the workbook is streamed
+    with openpyxl in read_only mode. Legacy formats openpyxl cannot open (e.g., .xls) fall back to pandas.read_excel.
+    """
+    for row in _read_workbook_rows(path):
+        if any(value is not None for value in row):
+            yield row
+
+def _read_workbook_rows(path):
+    if CalamineWorkbook is not None:
+        wb = sheet = None
+        try:
+            wb = CalamineWorkbook.from_path(path)
+            sheet = wb.get_sheet_by_index(0)
+        except Exception:
+            if wb is not None:
+                wb.close()
+        if sheet is not None:
+            return _iter_calamine_rows(wb, sheet)
+
+    try:
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore", category=UserWarning, module="openpyxl")
+            wb = openpyxl.load_workbook(path, read_only=True, data_only=True, keep_links=False)
+    except InvalidFileException:
+        df = pd.read_excel(path, header=None)
+        return df.astype(object).where(df.notna(), None).itertuples(index=False, name=None)
+
+    return _iter_openpyxl_rows(wb)
+
+def _iter_calamine_rows(wb, sheet):
+    try:
+        for row in sheet.iter_rows():
+            yield tuple(_calamine_value(value) for value in row)
+    finally:
+        wb.close()
+
+def _calamine_value(value):
+    # calamine reports empty cells as empty strings rather than None, and every number as a float;
+    # integral floats become ints as they do with openpyxl and pandas' calamine engine (e.g., Site # 12, not 12.0)
+    if value == '':
+        return None
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+def _iter_openpyxl_rows(wb):
+    try:
+        ws = wb.worksheets[0]
+        # Exported workbooks do not always record accurate sheet dimensions
+        ws.reset_dimensions()
+        yield from ws.iter_rows(values_only=True)
+    finally:
+        wb.close()
 
 def validate_name_format(name):
     """
     Validates that the name follows the obfuscated format: 'L............, F.....'.
     Returns True if valid, False otherwise.
     """
-    import re
-    pattern = r"^[A-Za-z]+\.*?, [A-Za-z]\.*$"
-    return bool(re.match(pattern, name))
-
-def reporting_category(row):
-    if row['Reservation Status'] in ['RESERVED', 'CHECKED_IN', 'CHECKED_OUT']:
-        cat = row['Arrival MonthYear'] + ' - ' + row['Camper Footprint']
-        if row['observed']:
-            cat += ' - Observed'
-        else:
-            cat += ' - Not Observed'
-        return cat
-    else:
-        return None
-    
\ No newline at end of file
+    return _NAME_RE.match(name) is not None
+
+def reporting_category(df):
+    """
+    Builds the reporting category for each reservation from its arrival month/year, camper footprint,
+    and whether it was observed by staff (e.g., 'July 2025 - tent - Observed').
+    Returns a Series that is missing for reservations that are not RESERVED, CHECKED_IN, or CHECKED_OUT.
+    """
+    reportable = df['Reservation Status'].isin(['RESERVED', 'CHECKED_IN', 'CHECKED_OUT'])
+    observed = np.where(df['observed'], ' - Observed', ' - Not Observed')
+    category = df['Arrival MonthYear'].astype('string') + ' - ' + df['Camper Footprint'].astype('string') + observed
+    return category.where(reportable)
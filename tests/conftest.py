@@ -0,0 +1,12 @@
+import os
+import pytest
+from pyfedcamp.reservations import Reservations
+
+@pytest.fixture(scope="session")
+def sample_file():
+    return os.path.join(os.path.dirname(__file__), "data", "Camping_Reservation_Detail_2025-07-08_to_2025-07-08.xlsx")
+
+@pytest.fixture(scope="session")
+def parsed_reservations(sample_file):
+    # Shared by tests that only read from Reservations; tests that modify it construct their own
+    return Reservations(sample_file)
@@ -1,15 +1,7 @@
-import pytest
-import os
 from pyfedcamp.placards import build_placards
-from pyfedcamp.reservations import Reservations
 
-@pytest.fixture
-def sample_file():
-    return os.path.join(os.path.dirname(__file__), "data", "Camping_Reservation_Detail_2025-07-08_to_2025-07-08.xlsx")
-
-def test_placards_build_placards(sample_file):
-    res = Reservations(sample_file)
-    test_records = res.reservations.head(4)[
+def test_placards_build_placards(parsed_reservations):
+    test_records = parsed_reservations.reservations.head(4)[
         [
             'ReservationNumber',
             'SiteNumber',
@@ -22,4 +14,8 @@ def test_placards_build_placards(sample_file):
     pdf_bytes = build_placards(test_records, filename=None)
     assert isinstance(pdf_bytes, bytes)
     assert len(pdf_bytes) > 100  # Should not be empty
-    assert pdf_bytes.startswith(b'%PDF')  # PDF files start with '%PDF'
\ No newline at end of file
+    assert pdf_bytes.startswith(b'%PDF')  # PDF files start with '%PDF'
+
+def test_placards_build_placards_from_dataframe(parsed_reservations):
+    pdf_bytes = build_placards(parsed_reservations.reservations.head(5), filename=None)
+    assert pdf_bytes.startswith(b'%PDF')
@@ -1,18 +1,43 @@
 import pytest
+import io
 import os
+import tarfile
+import threading
+import zipfile
+import openpyxl
+from openpyxl.workbook.views import BookView
+import pandas as pd
+from pyfedcamp import reservations
 from pyfedcamp.reservations import Reservations
 
-@pytest.fixture
-def sample_file():
-    return os.path.join(os.path.dirname(__file__), "data", "Camping_Reservation_Detail_2025-07-08_to_2025-07-08.xlsx")
+def test_unobfuscated_names_rejected(sample_file, tmp_path):
+    wb = openpyxl.load_workbook(sample_file)
+    ws = wb.active
+    name_col = [cell.value for cell in ws[11]].index('Primary Occupant Name') + 1
+    ws.cell(row=12, column=name_col, value='Smith, John')
+    for row in range(13, ws.max_row + 1):
+        ws.cell(row=row, column=name_col, value='Doe, Jane')
+    unobfuscated_file = tmp_path / "unobfuscated.xlsx"
+    wb.save(unobfuscated_file)
+    with pytest.raises(ValueError, match="obfuscated"):
+        Reservations(str(unobfuscated_file))
+
+def test_missing_header_row_rejected(tmp_path):
+    wb = openpyxl.Workbook()
+    wb.active.append(["Camping Reservation Detail Report"])
+    wb.active.append(["Loop", "Site #", "Reservation #"])
+    missing_header_file = tmp_path / "missing_header.xlsx"
+    wb.save(missing_header_file)
+    with pytest.raises(ValueError, match="required columns"):
+        Reservations(str(missing_header_file))
 
 def test_file_not_found():
     with pytest.raises(FileNotFoundError):
         Reservations("nonexistent_file.xlsx")
 
-def test_reservations_process_spreadsheet(sample_file):
+def test_reservations_process_spreadsheet(sample_file, parsed_reservations):
     assert os.path.exists(sample_file), "Sample data file does not exist for testing."
-    res = Reservations(sample_file)
+    res = parsed_reservations
     assert hasattr(res, "location")
     assert hasattr(res, "run_date")
     assert not res.reservations.empty
@@ -23,25 +48,229 @@ def test_reservations_process_spreadsheet(sample_file):
     ]:
         assert col in res.reservations.columns
 
-def test_occupied_overnights_and_summary(sample_file):
+def test_openpyxl_fallback_matches_default_reader(sample_file, parsed_reservations, monkeypatch):
+    res = parsed_reservations
+    monkeypatch.setattr(reservations, "CalamineWorkbook", None)
+    fallback = Reservations(sample_file)
+    assert fallback.location == res.location
+    assert fallback.run_date == res.run_date
+    assert fallback.reservations.equals(res.reservations)
+
+@pytest.mark.parametrize("use_calamine", [True, False])
+def test_numeric_id_cells_read_as_integers(sample_file, tmp_path, monkeypatch, use_calamine):
+    if not use_calamine:
+        monkeypatch.setattr(reservations, "CalamineWorkbook", None)
+    elif reservations.CalamineWorkbook is None:
+        pytest.skip("python-calamine is not installed")
+    wb = openpyxl.load_workbook(sample_file)
+    ws = wb.active
+    header = [cell.value for cell in ws[11]]
+    ws.cell(row=12, column=header.index('Site #') + 1, value=12)
+    ws.cell(row=12, column=header.index('Reservation #') + 1, value=782005369)
+    numeric_ids_file = tmp_path / "numeric_ids.xlsx"
+    wb.save(numeric_ids_file)
+    first = Reservations(str(numeric_ids_file)).reservations.iloc[0]
+    assert (first['SiteNumber'], first['Reservation #'], first['ReservationNumber']) == ('12', '782005369', '...005369')
+
+@pytest.mark.parametrize("use_calamine", [True, False])
+def test_first_worksheet_read_regardless_of_active_sheet(sample_file, parsed_reservations, tmp_path, monkeypatch, use_calamine):
+    if not use_calamine:
+        monkeypatch.setattr(reservations, "CalamineWorkbook", None)
+    elif reservations.CalamineWorkbook is None:
+        pytest.skip("python-calamine is not installed")
+    wb = openpyxl.load_workbook(sample_file)
+    wb.create_sheet("Notes").append(["Not a reservation report"])
+    # The exported report has no workbook views, so one is needed to record the active sheet
+    wb.views = [BookView()]
+    wb.active = 1
+    active_notes_file = tmp_path / "active_notes.xlsx"
+    wb.save(active_notes_file)
+    assert Reservations(str(active_notes_file)).reservations.equals(parsed_reservations.reservations)
+
+def test_calamine_workbook_closed_after_reading(sample_file, monkeypatch):
+    calamine = pytest.importorskip("python_calamine")
+    opened = []
+
+    class RecordingWorkbook:
+        @staticmethod
+        def from_path(path):
+            opened.append(calamine.CalamineWorkbook.from_path(path))
+            return opened[-1]
+
+    monkeypatch.setattr(reservations, "CalamineWorkbook", RecordingWorkbook)
+    assert list(reservations._iter_workbook_rows(sample_file))
+    with pytest.raises(calamine.WorkbookClosed):
+        opened[0].get_sheet_by_index(0)
+
+def test_derived_frames_built_on_access(sample_file):
     res = Reservations(sample_file)
+    for attr in ["occupied_reservations_by_day", "daily_reservation_summary", "busiest_days"]:
+        assert attr not in vars(res)
+    assert not res.busiest_days.empty
+    for attr in ["occupied_reservations_by_day", "daily_reservation_summary", "busiest_days"]:
+        assert attr in vars(res)
+
+def test_occupied_overnights_and_summary(parsed_reservations):
+    res = parsed_reservations
     assert not res.occupied_reservations_by_day.empty
     assert not res.daily_reservation_summary.empty
     for col in ["total_sites", "total_occupants"]:
         assert col in res.daily_reservation_summary.columns
 
-def test_busiest_day_of_week(sample_file):
-    res = Reservations(sample_file)
+def test_busiest_day_of_week(parsed_reservations):
+    res = parsed_reservations
     res.busiest_day_of_week()
     assert hasattr(res, "busiest_days")
     assert not res.busiest_days.empty
     for col in ["week", "Occupied Date", "day", "total_occupants", "weighted_occupants"]:
         assert col in res.busiest_days.columns
 
-def test_build_download_package(sample_file, tmp_path):
+@pytest.mark.parametrize("format,to_file", [("zip", False), ("tar.gz", True)])
+def test_build_download_package(parsed_reservations, tmp_path, format, to_file):
+    output_path = str(tmp_path / f"output.{format}") if to_file else None
+    result = parsed_reservations.build_download_package(format=format, output_path=output_path)
+    if to_file:
+        assert os.path.exists(result)
+    else:
+        assert isinstance(result, bytes)
+
+def test_occupied_overnights_multi_night_durations_and_summary():
+    res = Reservations.__new__(Reservations)
+    res.reservations = pd.DataFrame({
+        'SiteNumber': ['A1', 'A2', 'A3', 'A4'],
+        'Arrival Date': pd.to_datetime(['2025-07-08', '2025-07-08', '2025-07-09', '2025-07-10']),
+        'Departure Date': pd.to_datetime(['2025-07-11', '2025-07-09', '2025-07-10', '2025-07-11']),
+        'Camper Footprint': ['tent', 'RV', 'tent', 'unknown'],
+        'Occupants': [2, 4, 1, 3],
+        'occupied': [True, True, False, True],
+    })
+    res.get_occupied_overnights()
+    nights = res.occupied_reservations_by_day
+    assert list(nights['SiteNumber']) == ['A1', 'A1', 'A1', 'A2', 'A4']
+    assert list(nights['Occupied Date'].dt.strftime('%m/%d')) == ['07/08', '07/09', '07/10', '07/08', '07/10']
+    assert list(nights['Duration']) == ['first night', 'continuing night', 'continuing night', 'single night', 'single night']
+
+    res.summarize_reservations()
+    first_day = res.daily_reservation_summary.iloc[0]
+    assert (first_day['total_sites'], first_day['rv_sites'], first_day['tent_sites'], first_day['unknown']) == (2, 1, 1, 0)
+    assert (first_day['first_night_occupants'], first_day['single_night_occupants'], first_day['continuing_night_occupants']) == (2, 4, 0)
+    last_day = res.daily_reservation_summary.iloc[-1]
+    assert (last_day['total_sites'], last_day['rv_sites'], last_day['tent_sites'], last_day['unknown']) == (2, 0, 1, 1)
+
+def test_derived_frames_without_occupied_reservations(sample_file):
     res = Reservations(sample_file)
-    zip_bytes = res.build_download_package(format="zip", output_path=None)
-    assert isinstance(zip_bytes, bytes)
-    tar_path = tmp_path / "output.tar.gz"
-    out_path = res.build_download_package(format="tar.gz", output_path=str(tar_path))
-    assert os.path.exists(out_path)
\ No newline at end of file
+    res.reservations = res.reservations.assign(occupied=False)
+    assert res.occupied_reservations_by_day.empty
+    assert res.daily_reservation_summary.empty
+    assert res.busiest_days.empty
+    assert list(res.daily_reservation_summary.columns[:3]) == ['Occupied Date', 'total_sites', 'total_occupants']
+    assert res.daily_reservation_summary['total_sites'].dtype == 'int64'
+
+def test_reservations_cache_dir(sample_file, tmp_path):
+    pytest.importorskip("pyarrow")
+    res = Reservations(sample_file, cache_dir=str(tmp_path))
+    assert len(list(tmp_path.glob("*.parquet"))) == 1
+    cached = Reservations(sample_file, cache_dir=str(tmp_path))
+    assert (cached.location, cached.run_date) == (res.location, res.run_date)
+    assert cached.reservations.equals(res.reservations)
+    assert cached.reservations.dtypes.equals(res.reservations.dtypes)
+
+def test_reservations_cache_dir_requires_pyarrow(sample_file, tmp_path, monkeypatch):
+    monkeypatch.setattr(reservations, "pyarrow", None)
+    monkeypatch.setattr(Reservations, "process_spreadsheet", lambda self: pytest.fail("parsed before checking for pyarrow"))
+    with pytest.raises(ImportError, match="pyarrow"):
+        Reservations(sample_file, cache_dir=str(tmp_path))
+
+def test_get_checkin_reservations_by_campsite():
+    res = Reservations.__new__(Reservations)
+    res.reservations = pd.DataFrame({
+        'SiteNumber': pd.Categorical(['A1', 'A2', 'A1', 'B3']),
+        'CheckInTag': [True, True, True, False],
+        'ReservationNumber': ['...000001', '...000002', '...000003', '...000004'],
+    })
+    assert list(res.get_checkin_reservations()['ReservationNumber']) == ['...000001', '...000002', '...000003']
+    assert list(res.get_checkin_reservations(['A1', 'B3', 'Z9'])['ReservationNumber']) == ['...000001', '...000003']
+    assert res.get_checkin_reservations([]).empty
+
+def test_build_download_package_to_stream(parsed_reservations):
+    res = parsed_reservations
+    stream = io.BytesIO()
+    res.build_download_package(format="zip", output_path=stream)
+    with zipfile.ZipFile(stream) as zf:
+        assert "reservations.csv" in zf.namelist()
+        assert all(info.compress_type == zipfile.ZIP_DEFLATED for info in zf.infolist())
+        assert all(info.external_attr >> 16 == 0o644 for info in zf.infolist())
+        assert zf.read("reservations.csv").decode("utf-8").startswith("Reservation #,")
+
+def test_build_download_package_compression_level(parsed_reservations):
+    res = parsed_reservations
+    fastest = res.build_download_package(format="zip", output_path=None, compression_level=1)
+    smallest = res.build_download_package(format="zip", output_path=None, compression_level=9)
+    assert len(smallest) < len(fastest)
+    with pytest.raises(ValueError, match="compression_level"):
+        res.build_download_package(format="zip", output_path=None, compression_level=0)
+
+@pytest.mark.parametrize("use_gzip_command", [True, False])
+def test_build_download_package_tar_gz(parsed_reservations, monkeypatch, use_gzip_command):
+    if not use_gzip_command:
+        monkeypatch.setattr(reservations, "_GZIP_COMMAND", None)
+    elif reservations._GZIP_COMMAND is None:
+        pytest.skip("No gzip binary available")
+    data = parsed_reservations.build_download_package(format="tar.gz", output_path=None)
+    if not use_gzip_command:
+        assert data[4:8] == bytes(4)
+    with tarfile.open(fileobj=io.BytesIO(data), mode="r:gz") as tf:
+        assert "reservations.csv" in tf.getnames()
+
+def test_build_download_package_tar_gz_write_error():
+    if reservations._GZIP_COMMAND is None:
+        pytest.skip("No gzip binary available")
+
+    class FullDisk:
+        def write(self, data):
+            raise OSError(28, "No space left on device")
+
+    # Large enough to fill the compressor's pipes once the destination stops accepting output
+    dfs = {"big.csv": pd.DataFrame({"value": range(1_000_000)}).astype(str)}
+    errors = []
+
+    def build():
+        try:
+            reservations._write_download_archive(FullDisk(), "tar.gz", dfs)
+        except OSError as e:
+            errors.append(e)
+
+    thread = threading.Thread(target=build, daemon=True)
+    thread.start()
+    thread.join(60)
+    assert not thread.is_alive()
+    assert [e.errno for e in errors] == [28]
+
+def test_busiest_day_of_week_per_week():
+    res = Reservations.__new__(Reservations)
+    dates = pd.to_datetime(['2025-07-07', '2025-07-08', '2025-07-09', '2025-07-14', '2025-07-15'])
+    res.daily_reservation_summary = pd.DataFrame({
+        'Occupied Date': dates,
+        'week': dates.isocalendar().week.to_numpy(),
+        'day': dates.day_name(),
+        'total_occupants': [4, 5, 6, 2, 2],
+        'first_night_occupants': [1, 2, 0, 1, 1],
+        'single_night_occupants': [0, 0, 0, 1, 1],
+        'continuing_night_occupants': [3, 3, 6, 0, 0],
+    })
+    res.busiest_day_of_week()
+    assert list(res.busiest_days['week']) == [28, 29]
+    # Week 28 is decided by the first-night weighting; the week 29 tie goes to the earlier day
+    assert list(res.busiest_days['day']) == ['Tuesday', 'Monday']
+    assert list(res.busiest_days['weighted_occupants']) == [9, 5]
+
+def test_reporting_category():
+    df = pd.DataFrame({
+        'Reservation Status': ['RESERVED', 'CHECKED_OUT', 'CANCELLED'],
+        'Arrival MonthYear': ['July 2025', 'July 2025', 'July 2025'],
+        'Camper Footprint': ['tent', 'RV', 'tent'],
+        'observed': [False, True, False],
+    })
+    categories = reservations.reporting_category(df)
+    assert list(categories[:2]) == ['July 2025 - tent - Not Observed', 'July 2025 - RV - Observed']
+    assert pd.isna(categories[2])